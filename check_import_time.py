@@ -0,0 +1,72 @@
+"""Import-time regression check for the CLI entry point.
+
+Runs `python -X importtime` on the lightweight modules and fails if they pull in
+heavy dependencies (Streamlit, ReportLab platypus, requests) or take longer
+than the budget to import.
+
+Usage: python check_import_time.py [budget_ms]
+"""
+import subprocess
+import sys
+
+DEFAULT_BUDGET_MS = 50
+
+# module -> heavy modules it must not import at startup
+CHECKS = {
+    "main": ["streamlit", "reportlab", "requests"],
+    "utils.storage": ["streamlit", "reportlab", "requests"],
+    "utils.jd_parser": ["streamlit", "reportlab", "requests"],
+    "utils.text_resume": ["streamlit", "reportlab", "requests"],
+    "utils.export": ["streamlit", "reportlab", "requests"],
+    "utils.pdf_resume": ["streamlit", "requests", "reportlab.platypus", "reportlab.pdfgen"],
+}
+
+def import_times(module):
+    """Return {imported module: cumulative microseconds} for a fresh import of module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr}")
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+def check(module, forbidden, budget_ms):
+    times = import_times(module)
+    errors = []
+    for heavy in forbidden:
+        if any(name == heavy or name.startswith(heavy + ".") for name in times):
+            errors.append(f"{module} imports {heavy} at startup")
+    if module not in times:
+        # Already imported by the interpreter itself, or importtime output changed; either way we can't time it
+        errors.append(f"{module} does not appear in the -X importtime output")
+        print(f"{module}: not measured")
+        return errors
+    total_ms = times[module] / 1000
+    if total_ms > budget_ms:
+        errors.append(f"{module} took {total_ms:.1f}ms to import (budget {budget_ms}ms)")
+    print(f"{module}: {total_ms:.1f}ms")
+    return errors
+
+def main():
+    budget_ms = float(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_BUDGET_MS
+    errors = []
+    for module, forbidden in CHECKS.items():
+        errors.extend(check(module, forbidden, budget_ms))
+
+    if errors:
+        print("\nImport-time regressions:")
+        for error in errors:
+            print(f"- {error}")
+        sys.exit(1)
+    print("OK")
+
+if __name__ == "__main__":
+    main()
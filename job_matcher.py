@@ -1,13 +1,11 @@
 import streamlit as st
 import json
 import shutil
-import requests
 from pathlib import Path
 from typing import Dict, Any, Optional
 import re
 import logging
 from contextlib import contextmanager
-from utils.pdf_resume import generate_resume_pdf
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -18,6 +16,7 @@ OLLAMA_URL = "http://localhost:11434/api/generate"
 RESUME_PATH = Path("data/resume.json")
 TAILORED_PATH = Path("data/tailored_resume.json")
 OUTPUT_PATH = Path("output/tailored_resume.pdf")
+MAX_PAGES = 1
 
 class ResumeGenerator:
     """Handles resume generation and tailoring operations."""
@@ -55,6 +54,8 @@ class ResumeGenerator:
     
     def ollama_generate(self, prompt: str, max_retries: int = 3) -> Optional[str]:
         """Call Ollama API with error handling and retries."""
+        import requests
+        
         for attempt in range(max_retries):
             try:
                 response = requests.post(
@@ -188,12 +189,26 @@ Return the enhanced section as valid JSON only:"""
     
     def generate_pdf(self) -> bool:
         """Generate PDF from tailored resume."""
+        from utils.pdf_resume import generate_resume_pdf
+        
         try:
             # Ensure output directory exists
             OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
             
             with self.loading_spinner("Generating PDF..."):
-                generate_resume_pdf(str(TAILORED_PATH), str(OUTPUT_PATH))
+                report = generate_resume_pdf(str(TAILORED_PATH), str(OUTPUT_PATH), MAX_PAGES)
+            
+            target = "one page" if MAX_PAGES == 1 else f"{MAX_PAGES} pages"
+            if report["pages"] > MAX_PAGES:
+                st.warning(f"⚠️ Resume is still {report['pages']} pages after shrinking and trimming; "
+                           f"it could not be fit into {target}")
+            elif report["scale"] < 1.0:
+                st.info(f"Scaled fonts and spacing to {report['scale']:.0%} to fit into {target}")
+            if report["trimmed"]:
+                with st.expander(f"✂️ Trimmed {len(report['trimmed'])} bullet(s) to fit into {target}"):
+                    for item in report["trimmed"]:
+                        where = f"{item['section']} / {item['entry']}" if item.get("entry") else item["section"]
+                        st.write(f"- **{where}**: {item['bullet']}")
             return True
         except Exception as e:
             st.error(f"Error generating PDF: {e}")
@@ -1,8 +1,24 @@
-from utils.storage import add_experience, add_project, add_skills, load_resume
+import argparse
+import json
+import os
+import sys
+
+from utils.storage import (
+    DATA_FILE, add_experience, add_project, add_skills, apply_mutations_to_file, load_resume
+)
 from utils.jd_parser import extract_keywords
 
 def input_list(prompt):
-    return [item.strip() for item in input(prompt).split(",")]
+    return [item.strip() for item in input(prompt).split(",") if item.strip()]
+
+def input_lines(prompt):
+    print(prompt + " (one per line, empty line to finish)")
+    lines = []
+    while True:
+        line = input().strip()
+        if not line:
+            return lines
+        lines.append(line)
 
 def show_menu():
     print("\n==== Resume Optimizer ====")
@@ -13,7 +29,7 @@ def show_menu():
     print("5. Input Job Description")
     print("6. Exit")
 
-def main():
+def interactive():
     while True:
         show_menu()
         choice = input("Enter your choice: ")
@@ -21,19 +37,31 @@ def main():
         if choice == "1":
             role = input("Enter role: ")
             company = input("Enter company: ")
-            description = input("Describe your role: ")
+            start_date = input("Start date (e.g. Jan 2023): ")
+            is_present = input("Currently working here? (y/n): ").strip().lower() == "y"
+            end_date = "" if is_present else input("End date (e.g. May 2024): ")
+            bullets = input_lines("Describe your role")
             skills = input_list("Skills used (comma separated): ")
-            add_experience(role, company, description, skills)
+            add_experience(role, company, start_date, end_date, is_present, bullets, skills)
 
         elif choice == "2":
             title = input("Project title: ")
             description = input("Describe the project: ")
+            bullets = input_lines("Project bullet points")
             tech_stack = input_list("Tech used (comma separated): ")
-            add_project(title, description, tech_stack)
+            add_project(title, description, bullets, tech_stack)
 
         elif choice == "3":
             skills = input_list("Enter new skills (comma separated): ")
-            add_skills(skills)
+            resume = load_resume()
+            category = None
+            if isinstance(resume.get("skills"), dict):
+                categories = ", ".join(resume["skills"]) or "Programming, Technologies, Tools"
+                category = input(f"Category ({categories}): ").strip() or None
+            try:
+                add_skills(skills, category)
+            except ValueError as e:
+                print(f"Error: {e}")
 
         elif choice == "4":
             resume = load_resume()
@@ -53,5 +81,146 @@ def main():
         else:
             print("Invalid choice. Try again.")
 
+def load_mutations(path, fmt=None):
+    """Read a list of mutations from a JSON, YAML or NDJSON file ("-" for stdin)."""
+    if fmt is None:
+        ext = os.path.splitext(path)[1].lower()
+        fmt = {".yaml": "yaml", ".yml": "yaml", ".ndjson": "ndjson", ".jsonl": "ndjson"}.get(ext, "json")
+
+    if path == "-":
+        text = sys.stdin.read()
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            text = f.read()
+
+    if fmt == "ndjson":
+        mutations = []
+        for lineno, line in enumerate(text.splitlines(), start=1):
+            if not line.strip():
+                continue
+            try:
+                mutations.append(json.loads(line))
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{path} line {lineno}: {e}") from e
+        return mutations
+    if fmt == "yaml":
+        try:
+            import yaml
+        except ImportError:
+            raise ValueError("YAML mutation files need PyYAML (pip install pyyaml)")
+        try:
+            data = yaml.safe_load(text)
+        except yaml.YAMLError as e:
+            raise ValueError(f"{path}: invalid YAML: {e}") from e
+    else:
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"{path}: invalid JSON: {e}") from e
+    # A single mutation object is accepted as a batch of one
+    return data if isinstance(data, list) else [data]
+
+def cmd_apply(args):
+    try:
+        mutations = load_mutations(args.file, args.format)
+        apply_mutations_to_file(mutations, args.resume)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        print("No changes were written.", file=sys.stderr)
+        return 1
+    print(f"Applied {len(mutations)} mutation(s) to {args.resume}")
+    return 0
+
+def cmd_export(args):
+    from utils.export import export_resumes
+
+    jobs = args.jobs or os.cpu_count() or 1
+    try:
+        results = export_resumes(args.resumes, args.formats, args.out_dir, jobs, args.max_pages)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    failed = 0
+    overflowed = 0
+    for json_path, fmt, out_path, report, error in results:
+        if error is None and report is not None and args.max_pages is not None:
+            # Page fitting may shrink or drop content, so always say what it did
+            print(f"{json_path} -> {out_path} (scale {report['scale']:.2f}, "
+                  f"trimmed {len(report['trimmed'])} bullet(s))")
+            if report["pages"] > args.max_pages:
+                overflowed += 1
+                print(f"Warning: {out_path} is {report['pages']} pages, over the {args.max_pages}-page "
+                      "limit even after shrinking and trimming", file=sys.stderr)
+        elif error is None:
+            print(f"{json_path} -> {out_path}")
+        else:
+            failed += 1
+            print(f"{json_path} ({fmt}) failed: {error}", file=sys.stderr)
+    print(f"Exported {len(results) - failed}/{len(results)} file(s)")
+    return 1 if failed or overflowed else 0
+
+def cmd_view(args):
+    print(json.dumps(load_resume(args.resume), indent=2))
+    return 0
+
+def cmd_keywords(args):
+    if args.file == "-":
+        text = sys.stdin.read()
+    else:
+        with open(args.file, "r", encoding="utf-8") as f:
+            text = f.read()
+    print(extract_keywords(text, args.top))
+    return 0
+
+def max_pages_arg(value):
+    if value.lower() == "none":
+        return None
+    pages = int(value)
+    if pages < 1:
+        raise argparse.ArgumentTypeError("must be at least 1, or 'none'")
+    return pages
+
+def build_parser():
+    from utils.export import FORMATS
+
+    parser = argparse.ArgumentParser(description="Resume Optimizer")
+    sub = parser.add_subparsers(dest="command")
+
+    sub.add_parser("interactive", help="interactive menu (default when no command is given)")
+
+    p = sub.add_parser("apply", help="apply a batch of mutations in one load and one atomic write")
+    p.add_argument("file", help="mutation file (.json, .yaml/.yml, .ndjson/.jsonl) or - for stdin")
+    p.add_argument("--format", choices=["json", "yaml", "ndjson"], help="override format detection")
+    p.add_argument("--resume", default=DATA_FILE, help=f"resume to update (default: {DATA_FILE})")
+    p.set_defaults(func=cmd_apply)
+
+    p = sub.add_parser("export", help="export resumes to JSON, PDF and/or plain text")
+    p.add_argument("resumes", nargs="*", default=[DATA_FILE], help=f"resume JSON files (default: {DATA_FILE})")
+    p.add_argument("--formats", nargs="+", choices=FORMATS, default=list(FORMATS), help="formats to export")
+    p.add_argument("--out-dir", default="output", help="output directory (default: output)")
+    p.add_argument("--jobs", "-j", type=int, default=1, help="parallel export processes (0 = one per core)")
+    p.add_argument("--max-pages", type=max_pages_arg, default=1,
+                   help="fit PDFs to this many pages, shrinking text and trimming bullets "
+                        "(default: 1, 'none' to paginate freely)")
+    p.set_defaults(func=cmd_export)
+
+    p = sub.add_parser("view", help="print the resume JSON")
+    p.add_argument("--resume", default=DATA_FILE, help=f"resume to show (default: {DATA_FILE})")
+    p.set_defaults(func=cmd_view)
+
+    p = sub.add_parser("keywords", help="extract keywords from a job description")
+    p.add_argument("file", nargs="?", default="-", help="job description file (default: stdin)")
+    p.add_argument("--top", type=int, default=15, help="number of keywords (default: 15)")
+    p.set_defaults(func=cmd_keywords)
+
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.command in (None, "interactive"):
+        interactive()
+        return 0
+    return args.func(args)
+
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
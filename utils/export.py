@@ -0,0 +1,75 @@
+import os
+import shutil
+
+FORMATS = ("json", "pdf", "txt")
+
+def output_path(json_path, fmt, out_dir):
+    name = os.path.splitext(os.path.basename(json_path))[0]
+    return os.path.join(out_dir, f"{name}.{fmt}")
+
+def export_resume(json_path, fmt, out_dir, max_pages=1):
+    """Export one resume JSON file to out_dir/<name>.<fmt>.
+
+    Returns (out_path, report) where report is the PDF layout report from
+    generate_resume_pdf (None for other formats). max_pages=None turns page fitting off.
+    """
+    if not os.path.exists(json_path):
+        # storage.load_resume (used by the text renderer) would quietly fall back to an empty resume
+        raise FileNotFoundError(f"No such resume: {json_path}")
+    out_path = output_path(json_path, fmt, out_dir)
+    report = None
+    # Renderers are imported here so only the formats actually requested get loaded
+    if fmt == "json":
+        shutil.copyfile(json_path, out_path)
+    elif fmt == "pdf":
+        from utils.pdf_resume import generate_resume_pdf
+        report = generate_resume_pdf(json_path, out_path, max_pages)
+    elif fmt == "txt":
+        from utils.text_resume import generate_resume_text
+        generate_resume_text(json_path, out_path)
+    else:
+        raise ValueError(f"Unknown export format {fmt!r} (expected one of: {', '.join(FORMATS)})")
+    return out_path, report
+
+def export_resumes(json_paths, formats, out_dir, jobs=1, max_pages=1):
+    """Export every resume in every format, using up to `jobs` worker processes.
+
+    Returns a list of (json_path, fmt, out_path or None, report or None, error or None),
+    in input order. A failing export doesn't stop the others.
+
+    Raises ValueError before exporting anything if two inputs would write the
+    same output file (e.g. a/resume.json and b/resume.json).
+    """
+    tasks = [(json_path, fmt) for json_path in json_paths for fmt in formats]
+    sources = {}
+    for json_path, fmt in tasks:
+        out_path = os.path.normpath(output_path(json_path, fmt, out_dir))
+        if out_path in sources:
+            raise ValueError(f"{sources[out_path]} and {json_path} would both be exported to {out_path}; "
+                             "rename one or export them to separate directories")
+        sources[out_path] = json_path
+
+    os.makedirs(out_dir, exist_ok=True)
+    results = []
+
+    if jobs <= 1 or len(tasks) <= 1:
+        for json_path, fmt in tasks:
+            try:
+                out_path, report = export_resume(json_path, fmt, out_dir, max_pages)
+                results.append((json_path, fmt, out_path, report, None))
+            except Exception as e:
+                results.append((json_path, fmt, None, None, e))
+        return results
+
+    # PDF rendering is CPU bound, so use processes rather than threads
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(export_resume, json_path, fmt, out_dir, max_pages) for json_path, fmt in tasks]
+        for (json_path, fmt), future in zip(tasks, futures):
+            try:
+                out_path, report = future.result()
+                results.append((json_path, fmt, out_path, report, None))
+            except Exception as e:
+                results.append((json_path, fmt, None, None, e))
+    return results
@@ -1,16 +1,43 @@
+import copy
+import io
 import json
+import sys
+# Only the cheap reportlab modules are imported here; platypus, styles and the
+# canvas are imported inside the functions that render, so importing this module
+# (e.g. from the CLI) doesn't pay for them until a PDF is actually built.
 from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, ListFlowable, ListItem
 from reportlab.lib.units import inch
 
+MARGIN = 0.5*inch
+# SimpleDocTemplate's frame pads each side by 6pt
+FRAME_PADDING = 6
+FRAME_WIDTH = A4[0] - 2*MARGIN - 2*FRAME_PADDING
+FRAME_HEIGHT = A4[1] - 2*MARGIN - 2*FRAME_PADDING
+
+# Smallest font/spacing scale the layout pass will shrink to before trimming bullets
+MIN_SCALE = 0.8
+SCALE_STEPS = 6
+
 def load_resume(json_path):
     with open(json_path, "r") as f:
         return json.load(f)
 
-def make_resume_story(resume):
-    print ("resume", resume)
+def make_styles(scale=1.0):
+    from reportlab.lib.styles import getSampleStyleSheet
+
     styles = getSampleStyleSheet()
+    for name in ("Title", "Heading2", "Normal"):
+        style = styles[name]
+        style.fontSize *= scale
+        style.leading *= scale
+        style.spaceBefore *= scale
+        style.spaceAfter *= scale
+    return styles
+
+def make_resume_story(resume, scale=1.0):
+    from reportlab.platypus import Paragraph, Spacer, ListFlowable, ListItem
+
+    styles = make_styles(scale)
     story = []
 
     # Header
@@ -19,20 +46,25 @@ def make_resume_story(resume):
               f"<a href='{resume['linkedin']}'>LinkedIn</a> | <a href='{resume['github']}'>GitHub</a>"
     story.append(Paragraph(header, styles['Title']))
     story.append(Paragraph(contact, styles['Normal']))
-    story.append(Spacer(1, 0.05*inch))
+    story.append(Spacer(1, 0.05*inch*scale))
 
     # Education
     story.append(Paragraph("Education", styles['Heading2']))
     for edu in resume.get("education", []):
         story.append(Paragraph(f"- {edu}", styles['Normal']))
-    story.append(Spacer(1, 0.05*inch))
+    story.append(Spacer(1, 0.05*inch*scale))
 
     # Skills
     if resume.get("skills"):
         story.append(Paragraph("Skills", styles['Heading2']))
-        for cat, items in resume["skills"].items():
-            story.append(Paragraph(f"<b>{cat}:</b> {', '.join(items)}", styles['Normal']))
-        story.append(Spacer(1, 0.05*inch))
+        skills = resume["skills"]
+        if isinstance(skills, dict):
+            for cat, items in skills.items():
+                story.append(Paragraph(f"<b>{cat}:</b> {', '.join(items)}", styles['Normal']))
+        else:
+            # Resumes started from DEFAULT_RESUME keep skills as a flat list until a category is used
+            story.append(Paragraph(', '.join(skills), styles['Normal']))
+        story.append(Spacer(1, 0.05*inch*scale))
 
     # Experience
     if resume.get("experience"):
@@ -50,7 +82,7 @@ def make_resume_story(resume):
             story.append(exp_bullets)
             if exp.get("skills"):
                 story.append(Paragraph(f"<i>Skills: {', '.join(exp['skills'])}</i>", styles['Normal']))
-            story.append(Spacer(1, 0.05*inch))
+            story.append(Spacer(1, 0.05*inch*scale))
 
     # Projects
     if resume.get("projects"):
@@ -65,7 +97,7 @@ def make_resume_story(resume):
             story.append(proj_bullets)
             if proj.get("tech_stack"):
                 story.append(Paragraph(f"<i>Tech Stack: {', '.join(proj['tech_stack'])}</i>", styles['Normal']))
-            story.append(Spacer(1, 0.05*inch))
+            story.append(Spacer(1, 0.05*inch*scale))
 
     
     # Achievements
@@ -76,17 +108,146 @@ def make_resume_story(resume):
             bulletType='bullet'
         )
         story.append(ach_list)
-        story.append(Spacer(1, 0.1*inch))
+        story.append(Spacer(1, 0.1*inch*scale))
 
     return story
 
-def generate_resume_pdf(json_path, pdf_path):
+def count_pages(story, width=FRAME_WIDTH, height=FRAME_HEIGHT):
+    """Estimate how many pages a story fills by wrapping each flowable, without building a PDF."""
+    from reportlab.pdfgen.canvas import Canvas
+
+    # Some flowables (e.g. ListFlowable) need a canvas to wrap; it is never written out
+    canv = Canvas(io.BytesIO(), pagesize=A4)
+    pages = 1
+    remaining = height
+    queue = list(story)
+    while queue:
+        flowable = queue.pop(0)
+        at_top = remaining == height
+        space_before = 0 if at_top else flowable.getSpaceBefore()
+        _, h = flowable.wrapOn(canv, width, remaining - space_before)
+        if space_before + h <= remaining:
+            remaining -= space_before + h + flowable.getSpaceAfter()
+            continue
+        parts = flowable.splitOn(canv, width, remaining - space_before)
+        if len(parts) > 1:
+            queue[:0] = parts
+        elif at_top:
+            # Taller than a whole page; ReportLab would fail on it too, so just account for it
+            remaining = 0
+        else:
+            pages += 1
+            remaining = height
+            queue.insert(0, flowable)
+    return pages
+
+def trim_candidates(resume):
+    """Yield (section, index) of removable bullets, lowest priority first.
+
+    Achievements go first, then project bullets and finally experience bullets.
+    Within a section the last entry and its last bullet are dropped first, and
+    every project/experience entry keeps at least one bullet.
+    """
+    if resume.get("achievements"):
+        yield "achievements", None
+    for section in ("projects", "experience"):
+        for i in reversed(range(len(resume.get(section, [])))):
+            if len(resume[section][i].get("bullets", [])) > 1:
+                yield section, i
+
+def trim_lowest_priority_bullet(resume):
+    """Remove one lowest-priority bullet in place and return a description of it, or None."""
+    for section, i in trim_candidates(resume):
+        if i is None:
+            bullet = resume[section].pop()
+            return {"section": section, "bullet": bullet}
+        entry = resume[section][i]
+        bullet = entry["bullets"].pop()
+        name = entry.get("title") or entry.get("company", "")
+        return {"section": section, "entry": name, "bullet": bullet}
+    return None
+
+def fits(resume, scale, max_pages):
+    return count_pages(make_resume_story(resume, scale)) <= max_pages
+
+def best_scale(resume, max_pages):
+    """Binary search the largest scale in [MIN_SCALE, 1.0] that fits, or None if none does."""
+    if fits(resume, 1.0, max_pages):
+        return 1.0
+    if not fits(resume, MIN_SCALE, max_pages):
+        return None
+    low, high = MIN_SCALE, 1.0
+    for _ in range(SCALE_STEPS):
+        mid = (low + high) / 2
+        if fits(resume, mid, max_pages):
+            low = mid
+        else:
+            high = mid
+    return low
+
+def trimmed_copy(resume, count):
+    """Return a copy of resume with its `count` lowest-priority bullets removed, and the removed bullets."""
+    resume = copy.deepcopy(resume)
+    trimmed = []
+    for _ in range(count):
+        removed = trim_lowest_priority_bullet(resume)
+        if removed is None:
+            break
+        trimmed.append(removed)
+    return resume, trimmed
+
+def fit_resume(resume, max_pages=1):
+    """Shrink spacing/font size and trim bullets until the resume fits in max_pages.
+
+    Returns a trimmed copy of the resume and a report with the chosen scale,
+    the estimated page count and the bullets that were removed.
+    """
+    resume = copy.deepcopy(resume)
+    trimmed = []
+    scale = best_scale(resume, max_pages)
+    if scale is None:
+        # Removing bullets only ever shortens the story, so binary search the
+        # smallest number of trims that fits at MIN_SCALE instead of trying each
+        most_trimmed, all_trims = trimmed_copy(resume, sys.maxsize)
+        if not fits(most_trimmed, MIN_SCALE, max_pages):
+            # Nothing left to trim; render as small as allowed and let it spill over
+            resume, trimmed, scale = most_trimmed, all_trims, MIN_SCALE
+        else:
+            low, high = 1, len(all_trims)
+            while low < high:
+                mid = (low + high) // 2
+                if fits(trimmed_copy(resume, mid)[0], MIN_SCALE, max_pages):
+                    high = mid
+                else:
+                    low = mid + 1
+            resume, trimmed = trimmed_copy(resume, low)
+            scale = best_scale(resume, max_pages)
+
+    report = {
+        "scale": scale,
+        "pages": count_pages(make_resume_story(resume, scale)),
+        "trimmed": trimmed,
+    }
+    return resume, report
+
+def generate_resume_pdf(json_path, pdf_path, max_pages=1):
+    """Render the resume to pdf_path, fitting it into max_pages (None to paginate freely).
+
+    Returns the layout report from fit_resume.
+    """
+    from reportlab.platypus import SimpleDocTemplate
+
     resume = load_resume(json_path)
-    story = make_resume_story(resume)
+    if max_pages is None:
+        report = {"scale": 1.0, "pages": None, "trimmed": []}
+    else:
+        resume, report = fit_resume(resume, max_pages)
+    story = make_resume_story(resume, report["scale"])
     doc = SimpleDocTemplate(pdf_path, pagesize=A4,
-                            leftMargin=0.5*inch, rightMargin=0.5*inch,
-                            topMargin=0.5*inch, bottomMargin=0.5*inch)
+                            leftMargin=MARGIN, rightMargin=MARGIN,
+                            topMargin=MARGIN, bottomMargin=MARGIN)
     doc.build(story)
+    return report
 
 # Example usage:
 # generate_resume_pdf("../data/resume.json", "../output/resume.pdf")
\ No newline at end of file
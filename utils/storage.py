@@ -1,5 +1,7 @@
+import copy
 import json
 import os
+import shutil
 
 DATA_FILE = "data/resume.json"
 
@@ -18,74 +20,178 @@ DEFAULT_RESUME = {
     "skills": []
 }
 
-def load_resume():
-    if not os.path.exists(DATA_FILE):
-        return DEFAULT_RESUME.copy()
-    with open(DATA_FILE, "r") as f:
+CONTACT_FIELDS = ("firstName", "lastName", "phoneNumber", "email", "location", "linkedin", "github")
+
+def load_resume(path=None):
+    path = path or DATA_FILE
+    if not os.path.exists(path):
+        return copy.deepcopy(DEFAULT_RESUME)
+    with open(path, "r") as f:
         return json.load(f)
 
-def save_resume(data):
-    with open(DATA_FILE, "w") as f:
-        json.dump(data, f, indent=2)
+def save_resume(data, path=None):
+    # tempfile is only needed on writes, so keep it out of CLI startup
+    import tempfile
 
-def add_experience(role, company, startDate, endDate, isPresent, bullets, skills):
-    resume = load_resume()
+    # Write to a temp file next to the target and swap it in, so a crash never leaves half a resume
+    path = path or DATA_FILE
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".resume-", suffix=".json")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=2)
+        if os.path.exists(path):
+            shutil.copymode(path, tmp_path)
+        else:
+            os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+# In-memory mutations. Each takes the resume dict and edits it in place; the
+# public add_*/update_* functions below wrap them in a load/save.
+
+def _add_experience(resume, role, company, startDate="", endDate="", isPresent=False, bullets=None, skills=None):
     resume["experience"].append({
         "role": role,
         "company": company,
         "startDate": startDate,
         "endDate": endDate,
         "isPresent": isPresent,
-        "bullets": bullets,
-        "skills": skills
+        "bullets": bullets or [],
+        "skills": skills or []
     })
-    save_resume(resume)
 
-def add_project(title, description, bullets, tech_stack):
-    resume = load_resume()
+def _add_project(resume, title, description="", bullets=None, tech_stack=None):
     resume["projects"].append({
         "title": title,
         "description": description,
-        "bullets": bullets,
-        "tech_stack": tech_stack
+        "bullets": bullets or [],
+        "tech_stack": tech_stack or []
     })
-    save_resume(resume)
 
-def add_skills(skills):
-    resume = load_resume()
+def _add_skills(resume, skills, category=None):
+    if category is not None:
+        _add_skills_category(resume, category, skills)
+        return
+    if isinstance(resume.get("skills"), dict):
+        categories = ", ".join(resume["skills"]) or "e.g. Programming, Technologies, Tools"
+        raise ValueError(f"skills are grouped by category; pass a category ({categories})")
     resume["skills"].extend(skills)
     resume["skills"] = list(set(resume["skills"]))  # remove duplicates
+
+def _add_education(resume, education_entry):
+    resume["education"].append(education_entry)
+
+def _add_achievement(resume, achievement_entry):
+    resume["achievements"].append(achievement_entry)
+
+def _update_contact_info(resume, **fields):
+    unknown = set(fields) - set(CONTACT_FIELDS)
+    if unknown:
+        raise TypeError(f"unknown contact field(s): {', '.join(sorted(unknown))}")
+    resume.update(fields)
+
+def _add_skills_category(resume, category, skills):
+    # Ensure skills is a dict with the required categories
+    if "skills" not in resume or not isinstance(resume["skills"], dict):
+        resume["skills"] = {"Programming": [], "Technologies": [], "Tools": []}
+    if category not in resume["skills"]:
+        resume["skills"][category] = []
+    resume["skills"][category].extend(skills)
+    # Remove duplicates
+    resume["skills"][category] = list(set(resume["skills"][category]))
+
+MUTATIONS = {
+    "add_experience": _add_experience,
+    "add_project": _add_project,
+    "add_skills": _add_skills,
+    "add_education": _add_education,
+    "add_achievement": _add_achievement,
+    "update_contact_info": _update_contact_info,
+    "add_skills_category": _add_skills_category,
+}
+
+# Mutation arguments whose type is checked before applying, so bad input can't be saved
+STR_FIELDS = ("role", "company", "startDate", "endDate", "title", "description",
+              "education_entry", "achievement_entry", "category") + CONTACT_FIELDS
+LIST_FIELDS = ("bullets", "skills", "tech_stack")
+BOOL_FIELDS = ("isPresent",)
+
+def _check_mutation_args(args):
+    for field in STR_FIELDS:
+        if field in args and not isinstance(args[field], str):
+            raise ValueError(f"{field} must be a string, got {args[field]!r}")
+    for field in LIST_FIELDS:
+        value = args.get(field)
+        if value is not None and not (isinstance(value, list) and all(isinstance(v, str) for v in value)):
+            raise ValueError(f"{field} must be a list of strings, got {value!r}")
+    for field in BOOL_FIELDS:
+        if field in args and not isinstance(args[field], bool):
+            raise ValueError(f"{field} must be true or false, got {args[field]!r}")
+
+def apply_mutations(resume, mutations):
+    """Apply mutations to a copy of resume and return it; the original is untouched.
+
+    Each mutation is a dict like {"op": "add_project", "title": ..., ...} where
+    the remaining keys are the arguments of the matching function in MUTATIONS.
+    Raises ValueError naming the first bad mutation, so a batch is all-or-nothing.
+    """
+    resume = copy.deepcopy(resume)
+    for i, mutation in enumerate(mutations, start=1):
+        if not isinstance(mutation, dict):
+            raise ValueError(f"Mutation {i}: expected an object, got {type(mutation).__name__}")
+        args = dict(mutation)
+        op = args.pop("op", None)
+        if op not in MUTATIONS:
+            raise ValueError(f"Mutation {i}: unknown op {op!r} (expected one of: {', '.join(MUTATIONS)})")
+        try:
+            _check_mutation_args(args)
+            MUTATIONS[op](resume, **args)
+        except (ValueError, TypeError, KeyError, AttributeError) as e:
+            raise ValueError(f"Mutation {i} ({op}): {e}") from e
+    return resume
+
+def apply_mutations_to_file(mutations, path=None):
+    """Load the resume once, apply every mutation and save it once atomically."""
+    resume = apply_mutations(load_resume(path), mutations)
+    save_resume(resume, path)
+    return resume
+
+def add_experience(role, company, startDate, endDate, isPresent, bullets, skills):
+    resume = load_resume()
+    _add_experience(resume, role, company, startDate, endDate, isPresent, bullets, skills)
+    save_resume(resume)
+
+def add_project(title, description, bullets, tech_stack):
+    resume = load_resume()
+    _add_project(resume, title, description, bullets, tech_stack)
+    save_resume(resume)
+
+def add_skills(skills, category=None):
+    resume = load_resume()
+    _add_skills(resume, skills, category)
     save_resume(resume)
 
 def add_education(education_entry):
     resume = load_resume()
-    resume["education"].append(education_entry)
+    _add_education(resume, education_entry)
     save_resume(resume)
 
 def add_achievement(achievement_entry):
     resume = load_resume()
-    resume["achievements"].append(achievement_entry)
+    _add_achievement(resume, achievement_entry)
     save_resume(resume)
 
 def update_contact_info(firstName, lastName, phoneNumber, email, location, linkedin, github):
     resume = load_resume()
-    resume["firstName"] = firstName
-    resume["lastName"] = lastName
-    resume["phoneNumber"] = phoneNumber
-    resume["email"] = email
-    resume["location"] = location
-    resume["linkedin"] = linkedin
-    resume["github"] = github
+    _update_contact_info(resume, firstName=firstName, lastName=lastName, phoneNumber=phoneNumber,
+                         email=email, location=location, linkedin=linkedin, github=github)
     save_resume(resume)
 
 def add_skills_category(category, skills):
     resume = load_resume()
-    # Ensure skills is a dict with the required categories
-    if "skills" not in resume or not isinstance(resume["skills"], dict):
-        resume["skills"] = {"Programming": [], "Technologies": [], "Tools": []}
-    if category not in resume["skills"]:
-        resume["skills"][category] = []
-    resume["skills"][category].extend(skills)
-    # Remove duplicates
-    resume["skills"][category] = list(set(resume["skills"][category]))
+    _add_skills_category(resume, category, skills)
     save_resume(resume)
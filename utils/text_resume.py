@@ -0,0 +1,60 @@
+from utils.storage import load_resume
+
+def make_resume_text(resume):
+    """Render the resume as plain text, in the same section order as the PDF."""
+    lines = []
+
+    # Header
+    lines.append(f"{resume.get('firstName', '')} {resume.get('lastName', '')}".strip())
+    contact = [resume.get(key, "") for key in ("email", "phoneNumber", "location", "linkedin", "github")]
+    lines.append(" | ".join(c for c in contact if c))
+
+    # Education
+    lines += ["", "EDUCATION"]
+    for edu in resume.get("education", []):
+        lines.append(f"- {edu}")
+
+    # Skills
+    if resume.get("skills"):
+        lines += ["", "SKILLS"]
+        skills = resume["skills"]
+        if isinstance(skills, dict):
+            for cat, items in skills.items():
+                lines.append(f"{cat}: {', '.join(items)}")
+        else:
+            lines.append(", ".join(skills))
+
+    # Experience
+    if resume.get("experience"):
+        lines += ["", "EXPERIENCE"]
+        for exp in resume["experience"]:
+            start = exp.get("startDate", "")
+            end = "Present" if exp.get("isPresent") else exp.get("endDate", "")
+            lines.append(f"{exp.get('role', '')}, {exp.get('company', '')} ({start} - {end})")
+            for bullet in exp.get("bullets", []):
+                lines.append(f"  * {bullet}")
+            if exp.get("skills"):
+                lines.append(f"  Skills: {', '.join(exp['skills'])}")
+
+    # Projects
+    if resume.get("projects"):
+        lines += ["", "PROJECTS"]
+        for proj in resume["projects"]:
+            lines.append(proj.get("title", ""))
+            for bullet in proj.get("bullets", []):
+                lines.append(f"  * {bullet}")
+            if proj.get("tech_stack"):
+                lines.append(f"  Tech Stack: {', '.join(proj['tech_stack'])}")
+
+    # Achievements
+    if resume.get("achievements"):
+        lines += ["", "ACHIEVEMENTS"]
+        for ach in resume["achievements"]:
+            lines.append(f"* {ach}")
+
+    return "\n".join(lines) + "\n"
+
+def generate_resume_text(json_path, txt_path):
+    resume = load_resume(json_path)
+    with open(txt_path, "w", encoding="utf-8") as f:
+        f.write(make_resume_text(resume))